@@ -0,0 +1,197 @@
+# batch_moves.py
+"""Stream best moves for many positions without starting the Kivy app.
+
+Reads one position per line, either as NDJSON ({"board": [...]} or
+{"board": "X.O......"}) or as a bare 9-character board string using '.',
+'-' or '_' for empty cells. Writes one NDJSON result per input line, in
+input order; blank lines and unreachable positions (impossible piece
+counts, both sides with a line, or a winner who did not move last) get
+an "error" record. Values are exact full-depth scores at every difficulty,
+and --seed makes easy's random moves reproducible:
+
+    python batch_moves.py positions.ndjson --difficulty hard --workers 4
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.ai_engine import AIEngine
+from models.search_cache import configure_search_cache
+from utils.config_manager import ConfigManager
+
+EMPTY_MARKS = '.-_ '
+
+# Per-process engines keyed by the side they play, set by _init_worker
+_engines: Dict[str, AIEngine] = {}
+_seed: Optional[int] = None
+
+
+def _init_worker(difficulty: str, seed: Optional[int] = None,
+                 cache_size: Optional[int] = None) -> None:
+    """Warm up one engine per side to move in a worker process."""
+    global _seed
+    _seed = seed
+    if cache_size is not None:
+        configure_search_cache(cache_size)
+    for symbol, opponent in (('X', 'O'), ('O', 'X')):
+        engine = AIEngine(difficulty)
+        engine.ai_symbol = symbol
+        engine.player_symbol = opponent
+        _engines[symbol] = engine
+
+
+def parse_board(line: str) -> List[str]:
+    """Parse an NDJSON object or compact board string into a board list."""
+    line = line.strip()
+    board = json.loads(line)['board'] if line.startswith('{') else line
+    if isinstance(board, str):
+        board = ['' if cell in EMPTY_MARKS else cell for cell in board]
+    board = [cell or '' for cell in board]
+    if len(board) != 9 or any(cell not in ('', 'X', 'O') for cell in board):
+        raise ValueError("board must have 9 cells of 'X', 'O' or empty")
+    x_lead = board.count('X') - board.count('O')
+    if x_lead not in (0, 1):
+        raise ValueError("piece counts cannot arise with X moving first")
+    x_won = _has_line(board, 'X')
+    o_won = _has_line(board, 'O')
+    if x_won and o_won:
+        raise ValueError("both sides have completed a line")
+    if (x_won and x_lead != 1) or (o_won and x_lead != 0):
+        raise ValueError("the winner did not make the last move")
+    return board
+
+
+def _has_line(board: List[str], symbol: str) -> bool:
+    """Check whether symbol has completed a line."""
+    own_cells = [cell if cell == symbol else '' for cell in board]
+    return AIEngine._check_winner(own_cells) == symbol
+
+
+def analyse_line(line: str) -> Dict:
+    """Compute the move and value for one input line."""
+    try:
+        board = parse_board(line)
+    except (ValueError, KeyError, TypeError) as e:
+        return {'error': f"invalid position: {e}"}
+
+    result: Dict = {'board': ''.join(cell or '.' for cell in board)}
+    if AIEngine._check_winner(board) is not None:
+        result.update(move=-1, value=None)
+        return result
+    to_move = 'X' if board.count('X') == board.count('O') else 'O'
+    move, value = _engines[to_move].get_move_with_value(board)
+    result.update(move=move, value=value)
+    return result
+
+
+def analyse_chunk(chunk: List[Tuple[int, str]]) -> str:
+    """Analyse a chunk of numbered lines, returning NDJSON output."""
+    out = []
+    for line_number, line in chunk:
+        if _seed is not None:
+            # Seed per line so results do not depend on chunking or workers
+            random.seed(f"{_seed}:{line_number}")
+        result = analyse_line(line)
+        result['line'] = line_number
+        out.append(json.dumps(result, separators=(',', ':')))
+    return '\n'.join(out) + '\n'
+
+
+def read_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Group input lines into numbered chunks, lazily."""
+    numbered = enumerate(lines, 1)
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(lines: Iterable[str], out, difficulty: str = 'hard', workers: int = 1,
+        chunk_size: int = 1000, report_interval: float = 5.0,
+        seed: Optional[int] = None, cache_size: Optional[int] = None) -> int:
+    """Stream positions through a pool of warm engines.
+
+    At most two chunks per worker are in flight, so memory stays bounded
+    regardless of input size. Returns the number of positions processed.
+    """
+    processed = 0
+    started = last_report = time.monotonic()
+    pending = deque()
+    chunks = read_chunks(lines, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(difficulty, seed, cache_size)) as pool:
+        for chunk in chunks:
+            pending.append((len(chunk), pool.submit(analyse_chunk, chunk)))
+            if len(pending) < workers * 2:
+                continue
+            size, future = pending.popleft()
+            out.write(future.result())
+            processed += size
+            now = time.monotonic()
+            if now - last_report >= report_interval:
+                _report(processed, now - started)
+                last_report = now
+
+        while pending:
+            size, future = pending.popleft()
+            out.write(future.result())
+            processed += size
+
+    out.flush()
+    _report(processed, time.monotonic() - started)
+    return processed
+
+
+def _report(processed: int, elapsed: float) -> None:
+    """Print throughput to stderr, keeping stdout clean for results."""
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    print(f"{processed} positions in {elapsed:.1f}s ({rate:.0f}/s)",
+          file=sys.stderr, flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse command line arguments and run the batch."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('input', nargs='?', default='-',
+                        help="position file, or '-' for stdin")
+    parser.add_argument('--difficulty', default='hard',
+                        choices=('easy', 'medium', 'hard'))
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--report-interval', type=float, default=5.0,
+                        help='seconds between throughput reports')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='seed for reproducible easy-difficulty moves')
+    parser.add_argument('--cache-size', type=int, default=None,
+                        help='search cache entries per worker '
+                             '(default: ai.cache_size from config)')
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if args.cache_size is None:
+        # Read-only so a batch job never leaves a config.yml behind
+        args.cache_size = ConfigManager(read_only=True).get('ai', 'cache_size')
+
+    if args.input == '-':
+        run(sys.stdin, sys.stdout, args.difficulty, args.workers,
+            args.chunk_size, args.report_interval, args.seed,
+            args.cache_size)
+    else:
+        with open(args.input, 'r') as f:
+            run(f, sys.stdout, args.difficulty, args.workers,
+                args.chunk_size, args.report_interval, args.seed,
+                args.cache_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,22 +2,39 @@
 from typing import List
 import json
 from models.ai_engine import AIEngine
+from models.game_stats import GameStats
 from utils.logger import get_logger
+from utils.config_manager import ConfigManager
+from utils.event_bus import (EventBus, MOVE_MADE, GAME_ENDED,
+                             SCORES_CHANGED, STATE_RESET)
 
 class GameController:
     """Controller managing game logic and state."""
 
-    def __init__(self, game_board):
+    def __init__(self, game_board=None):
         self.logger = get_logger()
+        self.events = EventBus()
         self.game_board = game_board
-        self.game_board.controller = self
+        if game_board is not None:
+            self.attach_board(game_board)
         self.board_state = [''] * 9
         self.current_player = 'X'
-        self.ai_engine = AIEngine()
+        self.game_over = False
+        config = ConfigManager()
+        self.ai_workers = config.get('ai', 'parallel_workers')
+        self.difficulty = config.get('game', 'default_difficulty')
+        self.ai_engine = AIEngine(self.difficulty, workers=self.ai_workers)
         self.game_history = []
         self.scores = {'X': 0, 'O': 0, 'draw': 0}
+        self.stats = GameStats(config.get('game', 'stats_window'))
         self.load_game_state()
 
+    def attach_board(self, game_board) -> None:
+        """Connect a board view to the controller's event stream."""
+        game_board.controller = self
+        self.events.subscribe(MOVE_MADE, game_board.update_cell)
+        self.events.subscribe(STATE_RESET, game_board.reset_board)
+
     def handle_move(self, position: int) -> None:
         """Handle player move and trigger AI response."""
         if self._is_valid_move(position):
@@ -35,7 +52,9 @@ class GameController:
     def _make_move(self, position: int) -> None:
         """Execute a move on the board."""
         self.board_state[position] = self.current_player
-        self.game_board.update_cell(position, self.current_player)
+        if self.events.has_subscribers(MOVE_MADE):
+            self.events.emit(MOVE_MADE, position=position,
+                             symbol=self.current_player)
         self.game_history.append(self.board_state.copy())
         self._switch_player()
 
@@ -47,7 +66,8 @@ class GameController:
 
     def _is_valid_move(self, position: int) -> bool:
         """Check if the move is valid."""
-        return 0 <= position < 9 and self.board_state[position] == ''
+        return (not self.game_over and 0 <= position < 9
+                and self.board_state[position] == '')
 
     def _switch_player(self) -> None:
         """Switch current player."""
@@ -56,8 +76,12 @@ class GameController:
     def _check_game_end(self) -> bool:
         """Check if game has ended and update scores."""
         winner = self.ai_engine._check_winner(self.board_state)
-        if winner:
+        if winner and not self.game_over:
+            self.game_over = True
             self.scores[winner if winner != 'draw' else 'draw'] += 1
+            self.stats.record(self.difficulty, winner, len(self.game_history))
+            if self.events.has_subscribers(SCORES_CHANGED):
+                self.events.emit(SCORES_CHANGED, scores=dict(self.scores))
             self._handle_game_end(winner)
             return True
         return False
@@ -65,6 +89,9 @@ class GameController:
     def _handle_game_end(self, winner: str) -> None:
         """Handle game end state."""
         self.logger.info(f"Game ended. Winner: {winner}")
+        if self.events.has_subscribers(GAME_ENDED):
+            self.events.emit(GAME_ENDED, winner=winner,
+                             board=self.board_state.copy())
         # Implement win/lose/draw animations and notifications here
 
     def reset_game(self) -> None:
@@ -72,11 +99,15 @@ class GameController:
         self.board_state = [''] * 9
         self.current_player = 'X'
         self.game_history = []
-        self.game_board.reset_board()
+        self.game_over = False
+        if self.events.has_subscribers(STATE_RESET):
+            self.events.emit(STATE_RESET)
 
     def set_difficulty(self, difficulty: str) -> None:
         """Set AI difficulty level."""
-        self.ai_engine = AIEngine(difficulty)
+        self.difficulty = difficulty
+        self.ai_engine.close()
+        self.ai_engine = AIEngine(difficulty, workers=self.ai_workers)
 
     def save_game_state(self) -> None:
         """Save game state to file."""
@@ -88,6 +119,7 @@ class GameController:
         try:
             with open('game_state.json', 'w') as f:
                 json.dump(state, f)
+            self.stats.save('game_stats.json')
         except Exception as e:
             self.logger.error(f"Error saving game state: {e}")
 
@@ -99,7 +131,15 @@ class GameController:
                 self.scores = state['scores']
                 self.board_state = state['current_game']
                 self.game_history = state['history']
+                self.game_over = self.ai_engine._check_winner(
+                    self.board_state) is not None
         except FileNotFoundError:
             self.logger.info("No saved game state found")
         except Exception as e:
-            self.logger.error(f"Error loading game state: {e}")
\ No newline at end of file
+            self.logger.error(f"Error loading game state: {e}")
+        try:
+            self.stats.load('game_stats.json')
+        except FileNotFoundError:
+            self.logger.info("No saved statistics found")
+        except Exception as e:
+            self.logger.error(f"Error loading statistics: {e}")
\ No newline at end of file
@@ -6,7 +6,8 @@ from kivy.utils import get_color_from_hex
 from views.game_board import GameBoard
 from controllers.game_controller import GameController
 from utils.logger import setup_logger
-from utils.config_manager import load_config
+from utils.config_manager import load_config, ConfigManager
+from models.search_cache import configure_search_cache
 
 # Configure window and kivy settings
 Config.set('graphics', 'width', '800')
@@ -21,6 +22,7 @@ class TicTacToeApp(App):
         super().__init__(**kwargs)
         self.logger = setup_logger()
         self.config = load_config()
+        configure_search_cache(ConfigManager().get('ai', 'cache_size'))
         self.controller = None
         self.game_board = None
 
@@ -45,6 +47,7 @@ class TicTacToeApp(App):
         """Called when the application stops."""
         self.logger.info("Application stopped")
         self.controller.save_game_state()
+        self.controller.ai_engine.close()
 
 if __name__ == '__main__':
     TicTacToeApp().run()
\ No newline at end of file
@@ -2,11 +2,51 @@
 import random
 from typing import List, Tuple, Optional
 import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from models.search_cache import SearchCache, get_search_cache
+
+# Per-process state for root-split workers, set by _init_search_worker
+_worker_engine: Optional['AIEngine'] = None
+_worker_alpha = None
+
+
+def _init_search_worker(difficulty: str, shared_alpha) -> None:
+    """Initialize a root-split worker process."""
+    global _worker_engine, _worker_alpha
+    _worker_engine = AIEngine(difficulty)
+    _worker_alpha = shared_alpha
+
+
+def _search_root_move(board: List[str], move: int, ai_symbol: str,
+                      player_symbol: str, max_depth: int) -> float:
+    """Search a single root move, sharing the alpha bound between workers."""
+    # The calling engine's sides and depth travel with each task, since one
+    # pool may serve an engine whose symbols change between searches
+    _worker_engine.ai_symbol = ai_symbol
+    _worker_engine.player_symbol = player_symbol
+    _worker_engine.max_depth = max_depth
+    with _worker_alpha.get_lock():
+        alpha = _worker_alpha.value
+    board[move] = ai_symbol
+    # Scores are integral, so searching just below the shared bound keeps
+    # ties exact and the chosen move identical to the sequential search
+    score = _worker_engine._minimax(board, 0, False, alpha - 1, math.inf)
+    with _worker_alpha.get_lock():
+        if score > _worker_alpha.value:
+            _worker_alpha.value = score
+    return score
+
 
 class AIEngine:
     """AI engine implementing minimax algorithm with alpha-beta pruning."""
-    
-    def __init__(self, difficulty: str = 'medium'):
+
+    # Root-split only pays for its IPC when the remaining tree is large; on
+    # 3x3 that means the opening position at most
+    PARALLEL_MIN_EMPTY = 9
+
+    def __init__(self, difficulty: str = 'medium', workers: int = 1,
+                 cache: Optional[SearchCache] = None):
         self.difficulty = difficulty
         self.max_depth = {
             'easy': 1,
@@ -15,6 +55,28 @@ class AIEngine:
         }.get(difficulty, 3)
         self.ai_symbol = 'O'
         self.player_symbol = 'X'
+        self.workers = max(1, workers)
+        self.cache = cache if cache is not None else get_search_cache()
+        self._pool = None
+        self._shared_alpha = None
+
+    def close(self) -> None:
+        """Shut down the parallel search workers, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._shared_alpha = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Lazily start the root-split worker pool."""
+        if self._pool is None:
+            self._shared_alpha = multiprocessing.Value('d', -math.inf)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_search_worker,
+                initargs=(self.difficulty, self._shared_alpha)
+            )
+        return self._pool
 
     def get_move(self, board: List[str]) -> int:
         """Get the next move based on current difficulty level."""
@@ -25,6 +87,25 @@ class AIEngine:
         else:
             return self._get_best_move(board)
 
+    def get_move_with_value(self, board: List[str]) -> Tuple[int, float]:
+        """Get the next move together with its exact full-depth value."""
+        if self.difficulty not in ('easy', 'medium'):
+            return self._search_root(board)
+        move = self.get_move(board)
+        if move == -1:
+            return move, 0
+        # Score the chosen move with a full-depth search, so values mean the
+        # same thing at every difficulty rather than a shallow heuristic
+        depth = self.max_depth
+        self.max_depth = 9
+        board[move] = self.ai_symbol
+        try:
+            value = self._minimax(board, 0, False, -math.inf, math.inf)
+        finally:
+            board[move] = ''
+            self.max_depth = depth
+        return move, value
+
     def _get_random_move(self, board: List[str]) -> int:
         """Generate a random valid move."""
         empty_cells = [i for i, cell in enumerate(board) if not cell]
@@ -49,8 +130,36 @@ class AIEngine:
                 return pos
         return -1
 
+    def _find_winning_move(self, board: List[str], symbol: str) -> Optional[int]:
+        """Find a move that completes a line for symbol."""
+        for i in range(9):
+            if board[i] == '':
+                board[i] = symbol
+                winner = self._check_winner(board)
+                board[i] = ''
+                if winner == symbol:
+                    return i
+        return None
+
     def _get_best_move(self, board: List[str]) -> int:
         """Implement minimax algorithm with alpha-beta pruning."""
+        return self._search_root(board)[0]
+
+    def _search_root(self, board: List[str]) -> Tuple[int, float]:
+        """Search all root moves, returning the best move and its score."""
+        key = SearchCache.make_key(board, self.ai_symbol, self.max_depth)
+        result = self.cache.get(key)
+        if result is None:
+            if (self.workers > 1
+                    and board.count('') >= self.PARALLEL_MIN_EMPTY):
+                result = self._get_parallel_best_move(board)
+            else:
+                result = self._get_sequential_best_move(board)
+            self.cache.put(key, result)
+        return result
+
+    def _get_sequential_best_move(self, board: List[str]) -> Tuple[int, float]:
+        """Search root moves one after another on this process."""
         best_score = -math.inf
         best_move = -1
         alpha = -math.inf
@@ -68,7 +177,26 @@ class AIEngine:
                 if beta <= alpha:
                     break
 
-        return best_move
+        return best_move, best_score
+
+    def _get_parallel_best_move(self, board: List[str]) -> Tuple[int, float]:
+        """Split root moves across worker processes with a shared alpha."""
+        moves = [i for i in range(9) if board[i] == '']
+        if not moves:
+            return -1, -math.inf
+
+        pool = self._get_pool()
+        with self._shared_alpha.get_lock():
+            self._shared_alpha.value = -math.inf
+        futures = [pool.submit(_search_root_move, board.copy(), move,
+                               self.ai_symbol, self.player_symbol,
+                               self.max_depth)
+                   for move in moves]
+        scores = [future.result() for future in futures]
+
+        # First move with the highest score, as in the sequential search
+        best_score = max(scores)
+        return moves[scores.index(best_score)], best_score
 
     def _minimax(self, board: List[str], depth: int, is_maximizing: bool, 
                  alpha: float, beta: float) -> float:
@@ -0,0 +1,111 @@
+# models/game_stats.py
+import json
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+RESULTS = ('X', 'O', 'draw')
+
+
+class StatsBucket:
+    """Running aggregates for one difficulty and board variant."""
+
+    def __init__(self, window: int = 20):
+        self.counts = {result: 0 for result in RESULTS}
+        self.games = 0
+        self.total_moves = 0
+        self.streak_result: Optional[str] = None
+        self.streak_length = 0
+        self.best_streaks = {result: 0 for result in RESULTS}
+        self.recent = deque(maxlen=max(1, window))
+        self.recent_counts = {result: 0 for result in RESULTS}
+
+    def record(self, result: str, moves: int) -> None:
+        """Fold one finished game into the aggregates."""
+        self.counts[result] += 1
+        self.games += 1
+        self.total_moves += moves
+
+        if result == self.streak_result:
+            self.streak_length += 1
+        else:
+            self.streak_result = result
+            self.streak_length = 1
+        if self.streak_length > self.best_streaks[result]:
+            self.best_streaks[result] = self.streak_length
+
+        if len(self.recent) == self.recent.maxlen:
+            self.recent_counts[self.recent[0]] -= 1
+        self.recent.append(result)
+        self.recent_counts[result] += 1
+
+    @property
+    def average_moves(self) -> float:
+        """Average number of moves per finished game."""
+        return self.total_moves / self.games if self.games else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a compact JSON-friendly dict."""
+        return {
+            'counts': self.counts,
+            'games': self.games,
+            'moves': self.total_moves,
+            'streak': [self.streak_result, self.streak_length],
+            'best': self.best_streaks,
+            'recent': ''.join(result[0] for result in self.recent)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], window: int = 20) -> 'StatsBucket':
+        """Restore aggregates saved by to_dict."""
+        bucket = cls(window)
+        bucket.counts.update(data['counts'])
+        bucket.games = data['games']
+        bucket.total_moves = data['moves']
+        bucket.streak_result, bucket.streak_length = data['streak']
+        bucket.best_streaks.update(data['best'])
+        for code in data['recent'][-bucket.recent.maxlen:]:
+            result = 'draw' if code == 'd' else code
+            bucket.recent.append(result)
+            bucket.recent_counts[result] += 1
+        return bucket
+
+
+class GameStats:
+    """Score and statistics store keyed by difficulty and board variant."""
+
+    def __init__(self, window: int = 20):
+        self.window = max(1, window)
+        self.buckets: Dict[Tuple[str, str], StatsBucket] = {}
+
+    def record(self, difficulty: str, result: str, moves: int,
+               variant: str = '3x3') -> None:
+        """Record a finished game in O(1)."""
+        self.get(difficulty, variant).record(result, moves)
+
+    def get(self, difficulty: str, variant: str = '3x3') -> StatsBucket:
+        """Return the aggregates for a difficulty and variant."""
+        key = (difficulty, variant)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = StatsBucket(self.window)
+        return bucket
+
+    def save(self, path: str) -> None:
+        """Save aggregates to file."""
+        data = {
+            'window': self.window,
+            'buckets': {f"{difficulty}/{variant}": bucket.to_dict()
+                        for (difficulty, variant), bucket in self.buckets.items()}
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    def load(self, path: str) -> None:
+        """Load aggregates from file."""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        self.buckets = {}
+        for key, bucket in data['buckets'].items():
+            difficulty, variant = key.split('/', 1)
+            self.buckets[(difficulty, variant)] = StatsBucket.from_dict(
+                bucket, self.window)
@@ -0,0 +1,308 @@
+# models/pn_solver.py
+import json
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+INF = 10 ** 9
+
+
+class ProofNumberSolver:
+    """Depth-first proof-number (df-pn) solver for k-in-a-row boards.
+
+    Boards are flat lists of '', 'X' and 'O' in row-major order, the same
+    layout AIEngine uses. Results are exact and reported from the point of
+    view of the side to move: 'win', 'draw' or 'loss'.
+    """
+
+    def __init__(self, rows: int = 3, cols: int = 3, k: int = 3,
+                 max_nodes: int = 1_000_000,
+                 progress: Optional[Callable[[Dict], None]] = None,
+                 progress_interval: int = 100_000,
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: int = 1_000_000):
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.max_nodes = max_nodes
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.checkpoint_interval = checkpoint_interval
+        # key -> [phi, delta, work]; phi/delta are relative to the side to move
+        self.table: Dict[str, List[int]] = {}
+        self.nodes = 0
+        # (key, child keys) for every expanded node on the current path
+        self._path: List[Tuple[str, List[str]]] = []
+        self._cell_lines = self._build_lines()
+        self._lines = sorted({line for lines in self._cell_lines for line in lines})
+        self._symmetries = [itemgetter(*perm) for perm in self._build_symmetries()]
+        if self.checkpoint_path and self.checkpoint_path.exists():
+            self.load(self.checkpoint_path)
+
+    def _build_lines(self) -> List[List[Tuple[int, ...]]]:
+        """Precompute every winning line through each cell."""
+        lines = []
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for r in range(self.rows):
+                for c in range(self.cols):
+                    end_r = r + dr * (self.k - 1)
+                    end_c = c + dc * (self.k - 1)
+                    if 0 <= end_r < self.rows and 0 <= end_c < self.cols:
+                        lines.append(tuple((r + dr * i) * self.cols + c + dc * i
+                                           for i in range(self.k)))
+        cell_lines = [[] for _ in range(self.rows * self.cols)]
+        for line in lines:
+            for cell in line:
+                cell_lines[cell].append(line)
+        return cell_lines
+
+    def _build_symmetries(self) -> List[Tuple[int, ...]]:
+        """Cell permutations for the board's reflections and rotations."""
+        rows, cols = self.rows, self.cols
+        maps = [
+            lambda r, c: (r, c),
+            lambda r, c: (r, cols - 1 - c),
+            lambda r, c: (rows - 1 - r, c),
+            lambda r, c: (rows - 1 - r, cols - 1 - c),
+        ]
+        if rows == cols:
+            maps += [
+                lambda r, c: (c, r),
+                lambda r, c: (c, rows - 1 - r),
+                lambda r, c: (rows - 1 - c, r),
+                lambda r, c: (rows - 1 - c, cols - 1 - r),
+            ]
+        perms = set()
+        for transform in maps:
+            perms.add(tuple(
+                transform(i // cols, i % cols)[0] * cols
+                + transform(i // cols, i % cols)[1]
+                for i in range(rows * cols)))
+        return sorted(perms)
+
+    def solve(self, board: List[str]) -> str:
+        """Return the exact result of the position for the side to move."""
+        board = list(board)
+        if len(board) != self.rows * self.cols:
+            raise ValueError("Board size does not match solver dimensions")
+        to_move = self._side_to_move(board)
+        opponent = 'O' if to_move == 'X' else 'X'
+
+        if self._prove(board, to_move):
+            result = 'win'
+        elif self._prove(board, opponent):
+            result = 'loss'
+        else:
+            result = 'draw'
+        if self.checkpoint_path:
+            self.save(self.checkpoint_path)
+        return result
+
+    def _prove(self, board: List[str], attacker: str) -> bool:
+        """Run df-pn until it is known whether attacker can force a win."""
+        phi, delta = self._mid(board, attacker, -1, INF, INF)
+        # The root is an OR node when the attacker is to move
+        if self._side_to_move(board) == attacker:
+            return phi == 0
+        return delta == 0
+
+    def _mid(self, board: List[str], attacker: str, last: int,
+             th_phi: int, th_delta: int) -> Tuple[int, int]:
+        """Multiple iterative deepening step of df-pn."""
+        self.nodes += 1
+        self._report()
+        key = self._key(board, attacker)
+        to_move = self._side_to_move(board)
+
+        terminal = self._terminal(board, attacker, to_move, last)
+        if terminal is not None:
+            self.table[key] = [terminal[0], terminal[1], 1]
+            return terminal
+
+        if self._winning_cells(board, to_move):
+            # Winning on the spot settles the node for the side to move
+            self.table[key] = [0, INF, 1]
+            return 0, INF
+        threats = self._winning_cells(board, self._other(to_move))
+        if len(threats) > 1:
+            # Two open threats cannot both be blocked
+            self.table[key] = [INF, 0, 1]
+            return INF, 0
+
+        # A single threat forces the block; otherwise keep one move per
+        # symmetry class, since symmetric children share a table entry
+        candidates = threats or [i for i, cell in enumerate(board) if not cell]
+        moves = []
+        child_keys = []
+        for move in candidates:
+            board[move] = to_move
+            child_key = self._key(board, attacker)
+            board[move] = ''
+            if child_key not in child_keys:
+                moves.append(move)
+                child_keys.append(child_key)
+        work_before = self.nodes
+        self._path.append((key, child_keys))
+        while True:
+            phi, delta, best, phi_best, delta_2 = self._select(
+                moves, child_keys)
+            if phi >= th_phi or delta >= th_delta:
+                entry = self.table.get(key)
+                work = entry[2] if entry else 0
+                self.table[key] = [phi, delta, work + self.nodes - work_before]
+                self._collect_garbage()
+                self._path.pop()
+                return phi, delta
+
+            child_th_phi = th_delta + phi_best - delta
+            # 1+epsilon trick: stay in a child a little longer to limit
+            # re-expansion when the table is under memory pressure
+            child_th_delta = min(th_phi, delta_2 + delta_2 // 4 + 1)
+            board[best] = to_move
+            self._mid(board, attacker, best, min(child_th_phi, INF),
+                      child_th_delta)
+            board[best] = ''
+
+    def _select(self, moves: List[int],
+                child_keys: List[str]) -> Tuple[int, int, int, int, int]:
+        """Aggregate children and pick the most proving child."""
+        delta = 0
+        best = moves[0]
+        phi_best = INF
+        delta_best = INF
+        delta_2 = INF
+        for move, child_key in zip(moves, child_keys):
+            entry = self.table.get(child_key)
+            child_phi, child_delta = (entry[0], entry[1]) if entry else (1, 1)
+            delta = min(INF, delta + child_phi)
+            if child_delta < delta_best:
+                delta_2 = delta_best
+                best, phi_best, delta_best = move, child_phi, child_delta
+            elif child_delta < delta_2:
+                delta_2 = child_delta
+        phi = delta_best
+        return phi, delta, best, phi_best, delta_2
+
+    def _terminal(self, board: List[str], attacker: str, to_move: str,
+                  last: int) -> Optional[Tuple[int, int]]:
+        """Return (phi, delta) if the position is decided, else None."""
+        if last >= 0:
+            symbol = board[last]
+            for line in self._cell_lines[last]:
+                if all(board[i] == symbol for i in line):
+                    # The previous player completed a line
+                    return INF, 0
+        elif self._has_line(board):
+            return (INF, 0) if self._has_line(board, self._other(to_move)) else (0, INF)
+
+        if '' not in board:
+            # A draw counts against the attacker
+            return (INF, 0) if to_move == attacker else (0, INF)
+        return None
+
+    def _winning_cells(self, board: List[str], symbol: str) -> List[int]:
+        """Empty cells that would complete a line for symbol."""
+        cells = []
+        for line in self._lines:
+            empty = -1
+            for i in line:
+                if board[i] == symbol:
+                    continue
+                if board[i] or empty >= 0:
+                    break
+                empty = i
+            else:
+                if empty >= 0 and empty not in cells:
+                    cells.append(empty)
+        return cells
+
+    def _has_line(self, board: List[str], symbol: Optional[str] = None) -> bool:
+        """Check whether symbol (or either side) has completed a line."""
+        for cell, lines in enumerate(self._cell_lines):
+            if not board[cell] or (symbol and board[cell] != symbol):
+                continue
+            for line in lines:
+                if all(board[i] == board[cell] for i in line):
+                    return True
+        return False
+
+    def _collect_garbage(self) -> None:
+        """Keep the node table within budget, dropping the cheapest entries.
+
+        Entries are ranked by the work spent on their subtree, since large
+        subtrees are the most expensive to recompute. Nodes on the current
+        search path and their children are always kept, since selection
+        depends on them; a budget that cannot hold them raises instead of
+        re-expanding the same nodes forever.
+        """
+        if len(self.table) <= self.max_nodes:
+            return
+        keep = self.max_nodes // 2
+        pinned = []
+        for key, child_keys in self._path:
+            pinned.append(key)
+            pinned.extend(child_keys)
+        if len(pinned) > keep:
+            raise MemoryError(
+                f"max_nodes={self.max_nodes} cannot hold the search path "
+                f"({len(pinned)} entries needed)")
+        ranked = sorted(
+            self.table.items(),
+            key=lambda item: item[1][2],
+            reverse=True
+        )
+        table = dict(ranked[:keep - len(pinned)])
+        for key in pinned:
+            if key in self.table:
+                table[key] = self.table[key]
+        self.table = table
+
+    def _report(self) -> None:
+        """Emit progress and write periodic checkpoints."""
+        if self.progress and self.nodes % self.progress_interval == 0:
+            self.progress({'nodes': self.nodes, 'table_size': len(self.table)})
+        if self.checkpoint_path and self.nodes % self.checkpoint_interval == 0:
+            self.save(self.checkpoint_path)
+
+    def save(self, path) -> None:
+        """Save the node table so a later run can resume the solve."""
+        data = {
+            'rows': self.rows,
+            'cols': self.cols,
+            'k': self.k,
+            'table': self.table
+        }
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        tmp_path.replace(path)
+
+    def load(self, path) -> None:
+        """Load a node table saved by a solver with the same dimensions."""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if (data['rows'], data['cols'], data['k']) != (self.rows, self.cols, self.k):
+            raise ValueError("Saved table was built for a different board")
+        self.table = data['table']
+        self._collect_garbage()
+
+    def _key(self, board: List[str], attacker: str) -> str:
+        """Compact key for a position within a given proof.
+
+        Positions are canonicalised under the board's symmetries, so all
+        reflections and rotations of a position share one table entry.
+        """
+        cells = ''.join(cell or '.' for cell in board)
+        return attacker + min(''.join(perm(cells)) for perm in self._symmetries)
+
+    @staticmethod
+    def _side_to_move(board: List[str]) -> str:
+        """X moves first, so the side to move follows from piece counts."""
+        return 'X' if board.count('X') == board.count('O') else 'O'
+
+    @staticmethod
+    def _other(symbol: str) -> str:
+        """Return the opposing symbol."""
+        return 'O' if symbol == 'X' else 'X'
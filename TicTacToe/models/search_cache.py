@@ -0,0 +1,80 @@
+# models/search_cache.py
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class SearchCache:
+    """Thread-safe, size-bounded LRU cache of search results."""
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[int, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[int, float]]:
+        """Return the cached result for key, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Hashable, result: Tuple[int, float]) -> None:
+        """Store a result, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def resize(self, max_entries: int) -> None:
+        """Change the size bound, evicting entries if needed."""
+        with self._lock:
+            self.max_entries = max_entries
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_entries': self.max_entries
+            }
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond max_entries."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def make_key(board, symbol: str, depth: int) -> Tuple[str, str, int]:
+        """Key a position by its cells, side to move and search depth."""
+        return ''.join(cell or '.' for cell in board), symbol, depth
+
+
+_search_cache = SearchCache()
+
+
+def get_search_cache() -> SearchCache:
+    """Get the process-wide search cache shared by all engines."""
+    return _search_cache
+
+
+def configure_search_cache(max_entries: int) -> SearchCache:
+    """Apply the configured size bound to the shared cache at startup."""
+    _search_cache.resize(max_entries)
+    return _search_cache
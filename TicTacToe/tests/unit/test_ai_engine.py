@@ -0,0 +1,64 @@
+# tests/unit/test_ai_engine.py
+import random
+
+import pytest
+
+from models.ai_engine import AIEngine
+from models.search_cache import SearchCache
+
+
+def _random_positions(count, seed=1):
+    """Generate random unfinished positions reached by legal play."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = [''] * 9
+        symbol = 'X'
+        for _ in range(rng.randint(0, 7)):
+            empty = [i for i in range(9) if not board[i]]
+            board[rng.choice(empty)] = symbol
+            symbol = 'O' if symbol == 'X' else 'X'
+        if AIEngine._check_winner(board) is None:
+            positions.append(board)
+    return positions
+
+
+def _engine(side, workers):
+    """Build a hard engine playing side with a private cache."""
+    engine = AIEngine('hard', workers=workers, cache=SearchCache())
+    engine.ai_symbol = side
+    engine.player_symbol = 'O' if side == 'X' else 'X'
+    return engine
+
+
+@pytest.mark.parametrize('side', ['X', 'O'])
+def test_parallel_search_matches_sequential(side):
+    sequential = _engine(side, 1)
+    parallel = _engine(side, 3)
+    try:
+        for board in _random_positions(40):
+            assert (parallel._get_parallel_best_move(board.copy())
+                    == sequential._search_root(board.copy())), board
+    finally:
+        parallel.close()
+
+
+def test_parallel_search_for_x_example():
+    board = ['', 'O', 'X', '', 'O', 'X', '', 'X', 'O']
+    sequential = _engine('X', 1)
+    parallel = _engine('X', 3)
+    try:
+        assert parallel._get_parallel_best_move(board.copy()) == (0, 0)
+        assert sequential._search_root(board.copy()) == (0, 0)
+    finally:
+        parallel.close()
+
+
+def test_parallel_mode_skips_pool_for_small_trees():
+    engine = _engine('O', 3)
+    board = ['X', '', '', '', '', '', '', '', '']
+    try:
+        assert engine._search_root(board) == _engine('O', 1)._search_root(board)
+        assert engine._pool is None
+    finally:
+        engine.close()
@@ -0,0 +1,78 @@
+# tests/unit/test_batch_moves.py
+import io
+import json
+
+import pytest
+
+import batch_moves
+
+
+@pytest.fixture(autouse=True)
+def engines():
+    """Warm the module's engines as a pool worker would."""
+    batch_moves._init_worker('hard')
+
+
+def test_parse_compact_and_ndjson_boards():
+    expected = ['X', '', 'O', '', '', '', '', '', '']
+    assert batch_moves.parse_board('X.O......') == expected
+    assert batch_moves.parse_board(json.dumps({'board': expected})) == expected
+
+
+@pytest.mark.parametrize('line', ['', 'X.O', 'XXX......', 'OO.......',
+                                  'XXXOOO...', 'OOOXX.XX.', 'XXXOO.O..',
+                                  '{"x": 1}', '{bad'])
+def test_invalid_positions_are_reported(line):
+    assert 'error' in batch_moves.analyse_line(line)
+
+
+def test_finished_position_has_no_move():
+    result = batch_moves.analyse_line('XXXOO....')
+    assert result['move'] == -1 and result['value'] is None
+
+
+@pytest.mark.parametrize('difficulty', ['easy', 'medium', 'hard'])
+def test_values_are_full_depth_at_every_difficulty(difficulty):
+    batch_moves._init_worker(difficulty)
+    # Empty board is a draw with perfect play whatever the first move
+    assert batch_moves.analyse_line('.........')['value'] == 0
+
+
+def test_run_writes_one_record_per_line_in_order():
+    lines = ['X.O......\n', '\n', 'XXX......\n', 'XO.......\n']
+    out = io.StringIO()
+    processed = batch_moves.run(lines, out, workers=2, chunk_size=1,
+                                report_interval=60)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert processed == 4
+    assert [record['line'] for record in records] == [1, 2, 3, 4]
+    assert [('error' in record) for record in records] == [False, True, True, False]
+
+
+def test_seed_makes_easy_moves_reproducible():
+    lines = ['.........\n'] * 20
+
+    def play():
+        out = io.StringIO()
+        batch_moves.run(lines, out, 'easy', workers=2, chunk_size=3,
+                        report_interval=60, seed=7)
+        return out.getvalue()
+
+    assert play() == play()
+
+
+@pytest.mark.parametrize('option', ['--chunk-size', '--workers'])
+@pytest.mark.parametrize('value', ['0', '-1'])
+def test_non_positive_sizes_are_rejected(option, value):
+    with pytest.raises(SystemExit) as exit_info:
+        batch_moves.main(['-', option, value])
+    assert exit_info.value.code == 2
+
+
+def test_main_does_not_write_config(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr('sys.stdin', io.StringIO('X........\n'))
+    batch_moves.main(['-', '--report-interval', '60'])
+    assert json.loads(capsys.readouterr().out)['line'] == 1
+    assert list(tmp_path.iterdir()) == []
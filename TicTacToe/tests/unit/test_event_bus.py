@@ -0,0 +1,55 @@
+# tests/unit/test_event_bus.py
+from utils.event_bus import EventBatcher, EventBus, MOVE_MADE, SCORES_CHANGED
+
+
+def test_emit_delivers_payload_as_keywords():
+    bus = EventBus()
+    received = []
+    bus.subscribe(MOVE_MADE, lambda position, symbol: received.append((position, symbol)))
+    bus.emit(MOVE_MADE, position=4, symbol='X')
+    assert received == [(4, 'X')]
+
+
+def test_unsubscribe_during_emit_keeps_later_callbacks():
+    bus = EventBus()
+    received = []
+
+    def once(**payload):
+        received.append('once')
+        bus.unsubscribe(MOVE_MADE, once)
+
+    bus.subscribe(MOVE_MADE, once)
+    bus.subscribe(MOVE_MADE, lambda **payload: received.append('always'))
+    bus.emit(MOVE_MADE, position=0, symbol='X')
+    bus.emit(MOVE_MADE, position=1, symbol='O')
+    assert received == ['once', 'always', 'always']
+
+
+def test_has_subscribers_tracks_last_unsubscribe():
+    bus = EventBus()
+    callback = lambda **payload: None
+    assert not bus.has_subscribers(MOVE_MADE)
+    bus.subscribe(MOVE_MADE, callback)
+    assert bus.has_subscribers(MOVE_MADE)
+    bus.unsubscribe(MOVE_MADE, callback)
+    assert not bus.has_subscribers(MOVE_MADE)
+
+
+def test_batcher_coalesces_snapshot_events():
+    bus = EventBus()
+    batches = []
+    batcher = EventBatcher(batches.append, coalesce=[SCORES_CHANGED])
+    batcher.attach(bus, [MOVE_MADE, SCORES_CHANGED])
+
+    bus.emit(MOVE_MADE, position=0, symbol='X')
+    bus.emit(SCORES_CHANGED, scores={'X': 1})
+    bus.emit(MOVE_MADE, position=1, symbol='O')
+    bus.emit(SCORES_CHANGED, scores={'X': 2})
+    batcher.flush()
+    batcher.flush()
+
+    assert batches == [[
+        (MOVE_MADE, {'position': 0, 'symbol': 'X'}),
+        (SCORES_CHANGED, {'scores': {'X': 2}}),
+        (MOVE_MADE, {'position': 1, 'symbol': 'O'}),
+    ]]
@@ -0,0 +1,55 @@
+# tests/unit/test_game_controller.py
+import pytest
+
+from controllers.game_controller import GameController
+from utils.config_manager import ConfigManager
+from utils.event_bus import GAME_ENDED
+
+
+@pytest.fixture
+def controller(tmp_path, monkeypatch):
+    """Headless controller writing its config and saves under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    controller = GameController()
+    controller.set_difficulty('hard')
+    return controller
+
+
+def _play_out(controller):
+    """Click every cell in order, including after the game has ended."""
+    for position in range(9):
+        controller.handle_move(position)
+
+
+def test_finished_game_is_recorded_once(controller):
+    ended = []
+    controller.events.subscribe(GAME_ENDED, lambda **payload: ended.append(payload))
+    _play_out(controller)
+
+    bucket = controller.stats.get('hard')
+    assert controller.game_over
+    assert bucket.games == 1
+    assert bucket.streak_length == 1
+    assert sum(controller.scores.values()) == 1
+    assert len(ended) == 1
+
+
+def test_moves_rejected_until_reset(controller):
+    _play_out(controller)
+    board = controller.board_state.copy()
+    controller.handle_move(board.index('') if '' in board else 0)
+    assert controller.board_state == board
+
+    controller.reset_game()
+    assert not controller.game_over
+    controller.handle_move(4)
+    assert controller.board_state[4] == 'X'
+
+
+def test_default_difficulty_comes_from_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config.yml').write_text("game:\n  default_difficulty: hard\n")
+    controller = GameController()
+    assert controller.difficulty == 'hard'
+    assert controller.ai_engine.difficulty == 'hard'
+    assert ConfigManager.DEFAULT_CONFIG['game']['default_difficulty'] == 'medium'
@@ -0,0 +1,39 @@
+# tests/unit/test_game_stats.py
+from models.game_stats import GameStats, StatsBucket
+
+
+def test_record_updates_aggregates():
+    bucket = StatsBucket(window=2)
+    for result, moves in (('X', 5), ('X', 7), ('O', 6), ('draw', 9)):
+        bucket.record(result, moves)
+
+    assert bucket.games == 4
+    assert bucket.counts == {'X': 2, 'O': 1, 'draw': 1}
+    assert bucket.best_streaks['X'] == 2
+    assert (bucket.streak_result, bucket.streak_length) == ('draw', 1)
+    assert bucket.average_moves == 6.75
+    assert list(bucket.recent) == ['O', 'draw']
+    assert bucket.recent_counts == {'X': 0, 'O': 1, 'draw': 1}
+
+
+def test_zero_window_is_clamped():
+    stats = GameStats(window=0)
+    stats.record('hard', 'O', 6)
+    stats.record('hard', 'X', 7)
+    assert list(stats.get('hard').recent) == ['X']
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'stats.json')
+    stats = GameStats(window=3)
+    for result in ('O', 'draw', 'O', 'O'):
+        stats.record('hard', result, 8)
+    stats.record('easy', 'X', 5, variant='4x4')
+    stats.save(path)
+
+    loaded = GameStats(window=3)
+    loaded.load(path)
+    hard = loaded.get('hard')
+    assert hard.to_dict() == stats.get('hard').to_dict()
+    assert hard.recent_counts == {'X': 0, 'O': 2, 'draw': 1}
+    assert loaded.get('easy', '4x4').counts['X'] == 1
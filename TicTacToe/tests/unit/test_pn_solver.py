@@ -0,0 +1,75 @@
+# tests/unit/test_pn_solver.py
+import pytest
+
+from models.pn_solver import ProofNumberSolver
+
+
+def test_empty_3x3_is_draw():
+    assert ProofNumberSolver().solve([''] * 9) == 'draw'
+
+
+def test_empty_3x4_three_in_a_row_is_win():
+    assert ProofNumberSolver(3, 4, 3).solve([''] * 12) == 'win'
+
+
+def test_forced_loss_for_side_to_move():
+    # O to move cannot stop X's threat on the diagonal and the fork after it
+    board = ['X', 'O', '', '', 'X', '', '', '', '']
+    assert ProofNumberSolver().solve(board) == 'loss'
+
+
+def test_forced_win_for_side_to_move():
+    # X to move forks with 6, threatening both 3 and 2
+    board = ['X', 'O', '', '', 'X', '', '', '', 'O']
+    assert ProofNumberSolver().solve(board) == 'win'
+
+
+def _parse(cells):
+    """Turn a compact board string into a solver board."""
+    return ['' if cell == '.' else cell for cell in cells]
+
+
+# Expected results checked against a brute-force negamax
+@pytest.mark.parametrize('cells, result', [
+    ('XXO.OO.X........', 'draw'),
+    ('X.O..XO..O.X....', 'draw'),
+    ('X..OO.XOO.....XX', 'win'),
+    ('..XXO...O...OOXX', 'win'),
+])
+def test_4x4_four_in_a_row_positions(cells, result):
+    assert ProofNumberSolver(4, 4, 4).solve(_parse(cells)) == result
+
+
+def test_symmetric_positions_share_a_key():
+    solver = ProofNumberSolver(4, 4, 4)
+    corner = _parse('X...............')
+    rotations = ['...X............', '............X...', '...............X']
+    keys = {solver._key(_parse(cells), 'X') for cells in rotations}
+    assert keys == {solver._key(corner, 'X')}
+
+
+def test_small_budget_still_solves():
+    assert ProofNumberSolver(max_nodes=200).solve([''] * 9) == 'draw'
+
+
+def test_budget_below_search_path_raises():
+    with pytest.raises(MemoryError):
+        ProofNumberSolver(max_nodes=50).solve([''] * 9)
+
+
+def test_resume_from_checkpoint(tmp_path):
+    path = tmp_path / 'solve.json'
+    first = ProofNumberSolver(3, 4, 3, checkpoint_path=str(path))
+    assert first.solve([''] * 12) == 'win'
+    assert path.exists()
+
+    resumed = ProofNumberSolver(3, 4, 3, checkpoint_path=str(path))
+    assert resumed.solve([''] * 12) == 'win'
+    assert resumed.nodes < first.nodes
+
+
+def test_checkpoint_for_other_board_is_rejected(tmp_path):
+    path = tmp_path / 'solve.json'
+    ProofNumberSolver(checkpoint_path=str(path)).solve([''] * 9)
+    with pytest.raises(ValueError):
+        ProofNumberSolver(3, 4, 3, checkpoint_path=str(path))
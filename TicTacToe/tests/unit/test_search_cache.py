@@ -0,0 +1,71 @@
+# tests/unit/test_search_cache.py
+import threading
+
+from models.ai_engine import AIEngine
+from models.search_cache import SearchCache
+
+
+def test_hits_and_misses_are_counted():
+    cache = SearchCache()
+    assert cache.get('a') is None
+    cache.put('a', (4, 0))
+    assert cache.get('a') == (4, 0)
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1,
+                             'max_entries': 100_000}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchCache(max_entries=2)
+    cache.put('a', (0, 0))
+    cache.put('b', (1, 0))
+    cache.get('a')
+    cache.put('c', (2, 0))
+    assert cache.get('b') is None
+    assert cache.get('a') == (0, 0)
+    assert cache.get('c') == (2, 0)
+
+
+def test_resize_evicts_oldest_entries():
+    cache = SearchCache()
+    for i in range(5):
+        cache.put(i, (i, 0))
+    cache.resize(2)
+    assert cache.stats()['size'] == 2
+    assert cache.get(3) == (3, 0) and cache.get(0) is None
+
+
+def test_key_separates_side_and_depth():
+    board = ['X', '', '', '', '', '', '', '', '']
+    keys = {SearchCache.make_key(board, 'O', 9),
+            SearchCache.make_key(board, 'X', 9),
+            SearchCache.make_key(board, 'O', 3)}
+    assert len(keys) == 3
+
+
+def test_engines_share_results_across_instances():
+    cache = SearchCache()
+    board = ['X', '', '', '', '', '', '', '', '']
+    first = AIEngine('hard', cache=cache).get_move(board.copy())
+    second = AIEngine('hard', cache=cache).get_move(board.copy())
+    assert first == second
+    assert cache.stats()['hits'] == 1
+
+
+def test_concurrent_access_keeps_counters_consistent():
+    cache = SearchCache(max_entries=50)
+
+    def worker(offset):
+        for i in range(1000):
+            key = (offset + i) % 100
+            if cache.get(key) is None:
+                cache.put(key, (key, 0))
+
+    threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 4000
+    assert stats['size'] <= 50
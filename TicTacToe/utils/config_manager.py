@@ -1,4 +1,5 @@
 # utils/config_manager.py
+import copy
 import yaml
 from typing import Dict, Any
 from pathlib import Path
@@ -17,13 +18,16 @@ class ConfigManager:
             'default_difficulty': 'medium',
             'sound_enabled': True,
             'save_games': True,
-            'max_undo_steps': 10
+            'max_undo_steps': 10,
+            'stats_window': 20
         },
         'ai': {
             'max_response_time': 1.0,
             'easy_depth': 1,
             'medium_depth': 3,
-            'hard_depth': 9
+            'hard_depth': 9,
+            'parallel_workers': 1,
+            'cache_size': 100000
         },
         'theme': {
             'primary_color': '#2C3E50',
@@ -34,8 +38,9 @@ class ConfigManager:
         }
     }
 
-    def __init__(self):
+    def __init__(self, read_only: bool = False):
         self.config_path = Path('config.yml')
+        self.read_only = read_only
         self.config = self.load_config()
 
     def load_config(self) -> Dict[str, Any]:
@@ -45,24 +50,26 @@ class ConfigManager:
                 with open(self.config_path, 'r') as f:
                     config = yaml.safe_load(f)
                 return self._merge_with_defaults(config)
+            if self.read_only:
+                return copy.deepcopy(self.DEFAULT_CONFIG)
             return self._create_default_config()
         except Exception as e:
             print(f"Error loading config: {e}")
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
 
     def _create_default_config(self) -> Dict[str, Any]:
         """Create and save default configuration."""
         try:
             with open(self.config_path, 'w') as f:
                 yaml.dump(self.DEFAULT_CONFIG, f)
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
         except Exception as e:
             print(f"Error creating default config: {e}")
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
 
     def _merge_with_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge loaded config with defaults to ensure all keys exist."""
-        merged = self.DEFAULT_CONFIG.copy()
+        merged = copy.deepcopy(self.DEFAULT_CONFIG)
         for section, values in config.items():
             if section in merged:
                 merged[section].update(values)
@@ -81,6 +88,8 @@ class ConfigManager:
 
     def _save_config(self) -> None:
         """Save current configuration to file."""
+        if self.read_only:
+            return
         try:
             with open(self.config_path, 'w') as f:
                 yaml.dump(self.config, f)
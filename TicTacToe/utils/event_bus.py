@@ -0,0 +1,82 @@
+# utils/event_bus.py
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+MOVE_MADE = 'move_made'
+GAME_ENDED = 'game_ended'
+SCORES_CHANGED = 'scores_changed'
+STATE_RESET = 'state_reset'
+
+
+class EventBus:
+    """Minimal publish/subscribe hub for game events.
+
+    Subscribers are called with the event payload as keyword arguments.
+    Publishers should guard payload construction with has_subscribers()
+    so that nothing is built when nobody is listening.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable[..., Any]]] = {}
+
+    def subscribe(self, event: str, callback: Callable[..., Any]) -> None:
+        """Register callback for event."""
+        self._subscribers.setdefault(event, []).append(callback)
+
+    def unsubscribe(self, event: str, callback: Callable[..., Any]) -> None:
+        """Remove a previously registered callback."""
+        callbacks = self._subscribers.get(event)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._subscribers[event]
+
+    def has_subscribers(self, event: str) -> bool:
+        """Check whether anyone is listening for event."""
+        return event in self._subscribers
+
+    def emit(self, event: str, **payload: Any) -> None:
+        """Deliver event to its subscribers."""
+        # Iterate over a copy so callbacks may unsubscribe during delivery
+        for callback in list(self._subscribers.get(event, ())):
+            callback(**payload)
+
+
+class EventBatcher:
+    """Collect events and deliver them together on flush().
+
+    Events listed in coalesce keep only their latest payload per flush,
+    which suits state snapshots such as scores. A Kivy view can flush once
+    per frame with Clock.schedule_interval(lambda dt: batcher.flush(), 0).
+    """
+
+    def __init__(self, handler: Callable[[List[Tuple[str, Dict[str, Any]]]], None],
+                 coalesce: Iterable[str] = ()):
+        self.handler = handler
+        self.coalesce = set(coalesce)
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._latest: Dict[str, int] = {}
+
+    def attach(self, bus: EventBus, events: Iterable[str]) -> None:
+        """Subscribe the batcher to events on bus."""
+        for event in events:
+            bus.subscribe(event, self._collector(event))
+
+    def _collector(self, event: str) -> Callable[..., None]:
+        """Build the callback that queues one kind of event."""
+        def collect(**payload: Any) -> None:
+            if event in self.coalesce and event in self._latest:
+                self._pending[self._latest[event]] = (event, payload)
+                return
+            if event in self.coalesce:
+                self._latest[event] = len(self._pending)
+            self._pending.append((event, payload))
+        return collect
+
+    def flush(self) -> None:
+        """Deliver queued events to the handler, if any."""
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        self._latest = {}
+        self.handler(pending)
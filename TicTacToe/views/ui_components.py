@@ -6,6 +6,7 @@ from kivy.uix.spinner import Spinner
 from kivy.uix.popup import Popup
 from kivy.utils import get_color_from_hex
 from kivy.animation import Animation
+from utils.event_bus import SCORES_CHANGED
 
 class GameControls(BoxLayout):
     """Control panel for game settings and actions."""
@@ -17,6 +18,7 @@ class GameControls(BoxLayout):
         self.spacing = 10
         self.padding = 10
         self._init_ui()
+        self.controller.events.subscribe(SCORES_CHANGED, self.update_score)
 
     def _init_ui(self):
         """Initialize UI components."""